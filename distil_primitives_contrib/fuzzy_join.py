@@ -16,20 +16,19 @@
 import typing
 import os
 import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd  # type: ignore
 import numpy as np
 
-import haversine as hs
-
-from joblib import Parallel, delayed
+from joblib import effective_n_jobs
 
 from d3m import container, exceptions, utils as d3m_utils
 from d3m.base import utils as d3m_base_utils
 from d3m.metadata import base as metadata_base, hyperparams
 from d3m.primitive_interfaces import base, transformer
-from rapidfuzz import process
-from haversine import Unit
+from rapidfuzz import fuzz, process, utils
+from sklearn.neighbors import BallTree
 from dateutil import parser
 import version
 
@@ -180,6 +179,13 @@ class FuzzyJoinPrimitive(
 
     _DATETIME_JOIN_TYPES = set(("http://schema.org/DateTime",))
 
+    # number of left string keys scored against the right keys per cdist call - each call holds a
+    # float64 (tile, right keys) score matrix, 4096 * M * 8 bytes for M right keys
+    _STRING_TILE_ROWS = 4096
+
+    # mean earth radius, as used by the haversine package
+    _EARTH_RADIUS_METERS = 6371008.8
+
     _SUPPORTED_TYPES = (
         _STRING_JOIN_TYPES.union(_NUMERIC_JOIN_TYPES)
         .union(_DATETIME_JOIN_TYPES)
@@ -248,57 +254,50 @@ class FuzzyJoinPrimitive(
 
         accuracy = self.hyperparams["accuracy"]
         absolute_accuracy = self.hyperparams["absolute_accuracy"]
+        left_col = self.hyperparams["left_col"]
+        right_col = self.hyperparams["right_col"]
 
-        # hyperparams may be parsed as tuples
-        # floats could be integers if round number is passed in
-        if isinstance(accuracy, collections.Iterable):
-            accuracy = [float(a) for a in accuracy]
-        else:
-            accuracy = float(accuracy)
-        if isinstance(absolute_accuracy, collections.Iterable):
-            absolute_accuracy = list(absolute_accuracy)
-
-        if type(accuracy) == float and not type(absolute_accuracy) == bool:
+        if not isinstance(accuracy, (list, tuple)) and isinstance(
+            absolute_accuracy, (list, tuple)
+        ):
             raise exceptions.InvalidArgumentValueError(
                 "only 1 value of accuracy provided, but multiple values for absolute accuracy provided"
             )
-        if (not type(accuracy) == float) and type(absolute_accuracy) == bool:
+        if isinstance(accuracy, (list, tuple)) and not isinstance(
+            absolute_accuracy, (list, tuple)
+        ):
             raise exceptions.InvalidArgumentValueError(
                 "only 1 for absolute accuracy provided, but multiple values of accuracy provided"
             )
-        if type(accuracy) == float and not absolute_accuracy:
-            if accuracy <= 0.0 or accuracy > 1.0:
-                raise exceptions.InvalidArgumentValueError(
-                    "accuracy of " + str(accuracy) + " is out of range"
-                )
-        elif type(accuracy) == list and type(absolute_accuracy) == list:
-            if not len(accuracy) == len(absolute_accuracy):
-                raise exceptions.InvalidArgumentValueError(
-                    "the count of accuracy hyperparams does not match the count of absolute_accuracy hyperparams"
-                )
-            for i in range(len(accuracy)):
-                if (accuracy[i] <= 0.0 or accuracy[i] > 1.0) and not absolute_accuracy[i]:
-                    raise exceptions.InvalidArgumentValueError(
-                        "accuracy of " + str(acc) + " is out of range"
-                    )
+        if isinstance(left_col, (list, tuple)) != isinstance(right_col, (list, tuple)):
+            raise exceptions.InvalidArgumentTypeError(
+                "both left_col and right_col need to have same data type and if they are lists, the same list lengths"
+            )
 
-        left_col = self.hyperparams["left_col"]
-        right_col = self.hyperparams["right_col"]
+        # hyperparams may be parsed as tuples
+        # floats could be integers if round number is passed in
+        accuracy = [float(a) for a in self._as_list(accuracy)]
+        absolute_accuracy = self._as_list(absolute_accuracy)
+        left_col = self._as_list(left_col)
+        right_col = self._as_list(right_col)
 
-        if type(left_col) != type(right_col) or (
-            type(left_col) == list
-            and len(left_col) != len(right_col)
-            and type(accuracy) != list
-            and len(accuracy) != len(left_col)
-        ):
+        if len(accuracy) != len(absolute_accuracy):
+            raise exceptions.InvalidArgumentValueError(
+                "the count of accuracy hyperparams does not match the count of absolute_accuracy hyperparams"
+            )
+        if len(left_col) != len(right_col):
             raise exceptions.InvalidArgumentTypeError(
                 "both left_col and right_col need to have same data type and if they are lists, the same list lengths"
             )
-        if type(left_col) == str:
-            left_col = [left_col]
-            right_col = [right_col]
-            accuracy = [accuracy]
-            absolute_accuracy = [absolute_accuracy]
+        if len(accuracy) != len(left_col):
+            raise exceptions.InvalidArgumentValueError(
+                "the count of accuracy hyperparams does not match the count of join columns"
+            )
+        for acc, is_absolute in zip(accuracy, absolute_accuracy):
+            if (acc <= 0.0 or acc > 1.0) and not is_absolute:
+                raise exceptions.InvalidArgumentValueError(
+                    "accuracy of " + str(acc) + " is out of range"
+                )
 
         join_types = [
             self._get_join_semantic_type(
@@ -312,26 +311,25 @@ class FuzzyJoinPrimitive(
             for i in range(len(left_col))
         ]
 
-        num_splits = 32
-        joined_split = [None for i in range(num_splits)]
-        left_df_split = np.array_split(left_df, num_splits)
-        jobs = [delayed(self._produce_threaded)(
-            index = i,
-            left_df_full = left_df,
-            left_dfs = left_df_split,
-            right_df = right_df,
-            join_types = join_types,
-            left_col = left_col,
-            right_col = right_col,
-            accuracy = accuracy,
-            absolute_accuracy = absolute_accuracy
-        ) for i in range(num_splits)]
-        joined_data = Parallel(n_jobs=self.hyperparams["n_jobs"], backend="loky", verbose=10)(jobs)
-
-        # joined data needs to maintain order to mimic none split joining
-        for i, d in joined_data:
-            joined_split[i] = d
-        joined = pd.concat(joined_split, ignore_index = True)
+        # build the right side of the merge once - it is only read from after this point, so it can
+        # be shared between threads without copying
+        merge_right_df, new_right_cols, right_prepared = self._prepare_right(
+            left_df, left_col, right_df, right_col, join_types, accuracy
+        )
+
+        joined = self._produce(
+            left_df=left_df.reset_index(drop=True),
+            right_df=merge_right_df,
+            new_right_cols=new_right_cols,
+            right_prepared=right_prepared,
+            join_types=join_types,
+            left_col=left_col,
+            accuracy=accuracy,
+            absolute_accuracy=absolute_accuracy,
+        )
+        # the right merge frame and the match structures (ball trees, sorted choices) are not needed
+        # once the merge is done, so release them before the output dataset is built
+        del merge_right_df, right_prepared
 
         # create a new dataset to hold the joined data
         resource_map = {}
@@ -374,152 +372,59 @@ class FuzzyJoinPrimitive(
 
         return base.CallResult(result_dataset)
 
-    def _produce_threaded(
-        self,
-        *,
-        index: int,
-        left_df_full: container.DataFrame, # type: ignore
-        left_dfs: typing.Sequence[container.DataFrame],  # type: ignore
-        right_df: container.DataFrame,  # type: ignore
-        join_types: typing.Sequence[str],
-        left_col: typing.Sequence[int],
-        right_col: typing.Sequence[int],
-        accuracy: typing.Sequence[float],
-        absolute_accuracy: typing.Sequence[bool]
-    ) -> typing.Tuple[int, base.CallResult[Outputs]]:
-        if left_dfs[index].empty:
-            return (index, None)
-        output = self._produce(
-            left_df_full = left_df_full,
-            left_df = left_dfs[index].reset_index(drop=True),
-            right_df = right_df.copy(),
-            join_types = join_types,
-            left_col = left_col,
-            right_col = right_col,
-            accuracy = accuracy,
-            absolute_accuracy = absolute_accuracy
-        )
-        return (index, output)
-
     def _produce(
         self,
         *,
-        left_df_full: container.DataFrame, # type: ignore
         left_df: container.DataFrame,  # type: ignore
         right_df: container.DataFrame,  # type: ignore
+        new_right_cols: typing.Sequence[str],
+        right_prepared: typing.Sequence[typing.Dict[str, typing.Any]],
         join_types: typing.Sequence[str],
         left_col: typing.Sequence[int],
-        right_col: typing.Sequence[int],
         accuracy: typing.Sequence[float],
         absolute_accuracy: typing.Sequence[bool]
     ) -> base.CallResult[Outputs]:
 
-        # cycle through the columns to join the dataframes
-        right_cols_to_drop = []
-        new_left_cols = []
-        new_right_cols = []
-        for col_index in range(len(left_col)):
-            # depending on the joining type, make a new dataframe that has columns we will want to merge on
-            # keep track of which columns we will want to drop later on
-            if len(self._STRING_JOIN_TYPES.intersection(join_types[col_index])) > 0:
-                new_left_df = self._create_string_merge_cols(
+        # resolve the merge column for each join column on its own thread - the matching runs in
+        # numpy / rapidfuzz / sklearn, which release the GIL, so the columns resolve in parallel -
+        # the n_jobs cores are shared out between the column threads
+        n_jobs = effective_n_jobs(self.hyperparams["n_jobs"])
+        max_workers = max(min(n_jobs, len(left_col)), 1)
+        workers = max(n_jobs // max_workers, 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._create_merge_cols,
                     left_df,
-                    left_col[col_index],
-                    right_df,
-                    right_col[col_index],
-                    accuracy[col_index],
-                    col_index,
-                )
-                left_df[new_left_df.columns] = new_left_df
-                right_name = "righty_string" + str(col_index)
-                right_df.rename(
-                    columns={right_col[col_index]: right_name}, inplace=True
-                )
-                new_left_cols += list(new_left_df.columns)
-                new_right_cols.append(right_name)
-            elif len(self._NUMERIC_JOIN_TYPES.intersection(join_types[col_index])) > 0:
-                new_left_df = self._create_numeric_merge_cols(
-                    left_df,
-                    left_col[col_index],
-                    right_df,
-                    right_col[col_index],
-                    accuracy[col_index],
-                    col_index,
-                    absolute_accuracy[col_index],
-                )
-                left_df[new_left_df.columns] = new_left_df
-                right_name = "righty_numeric" + str(col_index)
-                right_df.rename(
-                    columns={right_col[col_index]: right_name}, inplace=True
-                )
-                new_left_cols += list(new_left_df.columns)
-                new_right_cols.append(right_name)
-            elif len(self._GEO_JOIN_TYPES.intersection(join_types[col_index])) > 0:
-                new_left_df, new_right_df = self._create_geo_vector_merging_cols(
-                    left_df,
-                    left_col[col_index],
-                    right_df,
-                    right_col[col_index],
-                    accuracy[col_index],
-                    col_index,
-                    absolute_accuracy[col_index],
-                )
-                left_df[new_left_df.columns] = new_left_df
-                right_df[new_right_df.columns] = new_right_df
-                new_left_cols += list(new_left_df.columns)
-                new_right_cols += list(new_right_df.columns)
-                right_cols_to_drop.append(right_col[col_index])
-            elif len(self._VECTOR_JOIN_TYPES.intersection(join_types[col_index])) > 0:
-                new_left_df, new_right_df = self._create_vector_merging_cols(
-                    left_df,
-                    left_col[col_index],
-                    right_df,
-                    right_col[col_index],
-                    accuracy[col_index],
-                    col_index,
-                    absolute_accuracy[col_index],
-                )
-                left_df[new_left_df.columns] = new_left_df
-                right_df[new_right_df.columns] = new_right_df
-                new_left_cols += list(new_left_df.columns)
-                new_right_cols += list(new_right_df.columns)
-                right_cols_to_drop.append(right_col[col_index])
-            elif len(self._DATETIME_JOIN_TYPES.intersection(join_types[col_index])) > 0:
-                tolerance = self._compute_datetime_tolerance(left_df_full, left_col[col_index], right_df, right_col[col_index], accuracy[col_index])
-                new_left_df, new_right_df = self._create_datetime_merge_cols(
-                    left_df,
-                    left_col[col_index],
-                    right_df,
-                    right_col[col_index],
-                    tolerance,
+                    left_col,
+                    right_prepared,
+                    join_types,
+                    accuracy,
+                    absolute_accuracy,
                     col_index,
+                    workers,
                 )
-                left_df[new_left_df.columns] = new_left_df
-                right_df[new_right_df.columns] = new_right_df
-                new_left_cols += list(new_left_df.columns)
-                new_right_cols += list(new_right_df.columns)
-                right_cols_to_drop.append(right_col[col_index])
-            else:
-                raise exceptions.InvalidArgumentValueError(
-                    "join not surpported on type " + str(join_types[col_index])
-                )
+                for col_index in range(len(left_col))
+            ]
+            left_merge_dfs = [future.result() for future in futures]
+        new_left_cols = [col for df in left_merge_dfs for col in df.columns]
 
-        if "d3mIndex" in right_df.columns:
-            right_cols_to_drop.append("d3mIndex")
-        right_df.drop(columns=right_cols_to_drop, inplace=True)
+        # add the merge columns in a single concat rather than copying the frame once per column
+        left_df = pd.concat([left_df] + left_merge_dfs, axis=1, copy=False)
+        del left_merge_dfs
 
         joined = pd.merge(
             left_df,
             right_df,
             how=self.hyperparams["join_type"],
             left_on=new_left_cols,
-            right_on=new_right_cols,
+            right_on=list(new_right_cols),
             suffixes=["_left", "_right"],
         )
 
         # don't want to keep columns that were created specifically for merging
         # also, inner merge keeps the right column we merge on, we want to remove it
-        joined.drop(columns=new_left_cols + new_right_cols, inplace=True)
+        joined.drop(columns=new_left_cols + list(new_right_cols), inplace=True)
 
         return joined
 
@@ -557,6 +462,202 @@ class FuzzyJoinPrimitive(
             right=right,
         )
 
+    @classmethod
+    def _as_list(cls, value: typing.Any) -> typing.List[typing.Any]:
+        # hyperparams can be either a single value or a sequence of values, one per join column
+        return list(value) if isinstance(value, (list, tuple)) else [value]
+
+    @classmethod
+    def _create_merge_cols(
+        cls,
+        left_df: container.DataFrame,
+        left_col: typing.Sequence[str],
+        right_prepared: typing.Sequence[typing.Dict[str, typing.Any]],
+        join_types: typing.Sequence[typing.Sequence[str]],
+        accuracy: typing.Sequence[float],
+        absolute_accuracy: typing.Sequence[bool],
+        col_index: int,
+        workers: int = 1,
+    ) -> pd.DataFrame:
+        # depending on the joining type, make a new dataframe that has columns we will want to merge on
+        if len(cls._STRING_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+            return cls._create_string_merge_cols(
+                left_df,
+                left_col[col_index],
+                right_prepared[col_index]["right_keys"],
+                accuracy[col_index],
+                col_index,
+                workers,
+            )
+        elif len(cls._NUMERIC_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+            return cls._create_numeric_merge_cols(
+                left_df,
+                left_col[col_index],
+                right_prepared[col_index]["sorted_choices"],
+                accuracy[col_index],
+                col_index,
+                absolute_accuracy[col_index],
+            )
+        elif len(cls._GEO_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+            return cls._create_geo_vector_merging_cols(
+                left_df,
+                left_col[col_index],
+                right_prepared[col_index]["right_points"],
+                right_prepared[col_index]["right_codes"],
+                right_prepared[col_index]["balltree"],
+                right_prepared[col_index]["balltree_rows"],
+                accuracy[col_index],
+                col_index,
+                absolute_accuracy[col_index],
+            )
+        elif len(cls._VECTOR_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+            return cls._create_vector_merging_cols(
+                left_df,
+                left_col[col_index],
+                right_prepared[col_index]["sorted_choices"],
+                right_prepared[col_index]["right_keys"],
+                accuracy[col_index],
+                col_index,
+                absolute_accuracy[col_index],
+            )
+        elif len(cls._DATETIME_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+            return cls._create_datetime_merge_cols(
+                right_prepared[col_index]["left_keys"],
+                right_prepared[col_index]["choices"],
+                right_prepared[col_index]["tolerance"],
+                col_index,
+            )
+        else:
+            raise exceptions.InvalidArgumentValueError(
+                "join not surpported on type " + str(join_types[col_index])
+            )
+
+    @classmethod
+    def _prepare_right(
+        cls,
+        left_df: container.DataFrame,
+        left_col: typing.Sequence[str],
+        right_df: container.DataFrame,
+        right_col: typing.Sequence[str],
+        join_types: typing.Sequence[typing.Sequence[str]],
+        accuracy: typing.Sequence[float],
+    ) -> typing.Tuple[
+        container.DataFrame, typing.List[str], typing.List[typing.Dict[str, typing.Any]]
+    ]:
+        # precompute the parts of the join that only depend on the right side: the right frame to
+        # merge against, the names of its merge columns, and the structures used to match each
+        # join column - the full left side is only needed for the datetime tolerances
+        # the merge code frames are built on a default index, so the right frame needs one too for
+        # the codes to line up with its rows
+        right_df = right_df.reset_index(drop=True)
+        prepared: typing.List[typing.Dict[str, typing.Any]] = []
+        new_right_cols: typing.List[str] = []
+        right_merge_dfs: typing.List[pd.DataFrame] = []
+        right_cols_to_drop: typing.List[str] = []
+        for col_index in range(len(right_col)):
+            col = right_col[col_index]
+            if len(cls._STRING_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+                # string and numeric columns are merged on integer codes for the right keys rather
+                # than the keys themselves
+                right_name = f"righty_string{col_index}"
+                codes, right_keys = pd.factorize(right_df[col])
+                # missing keys get their own code so they never join to an unmatched (-1) left row
+                codes[codes < 0] = -2
+                right_merge_dfs.append(pd.DataFrame({right_name: codes}))
+                new_right_cols.append(right_name)
+                right_cols_to_drop.append(col)
+                prepared.append({"right_keys": right_keys})
+            elif len(cls._NUMERIC_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+                right_name = f"righty_numeric{col_index}"
+                values = pd.to_numeric(right_df[col]).to_numpy(dtype=float)
+                choices = cls._sorted_choices(values)
+                right_merge_dfs.append(
+                    pd.DataFrame(
+                        {right_name: cls._numeric_codes(values, choices)}
+                    )
+                )
+                new_right_cols.append(right_name)
+                right_cols_to_drop.append(col)
+                prepared.append({"sorted_choices": choices})
+            elif len(cls._GEO_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+                right_points = cls._create_geo_points(right_df, col)
+                tree, tree_rows = cls._create_geo_index(right_points[:, 0])
+                # geo and vector columns are merged on a single code per distinct right value
+                # rather than on one column per point or component
+                right_name = f"righty_vector{col_index}"
+                _, right_codes = cls._row_codes(right_points.reshape(len(right_points), -1))
+                right_merge_dfs.append(pd.DataFrame({right_name: right_codes}))
+                new_right_cols.append(right_name)
+                right_cols_to_drop.append(col)
+                prepared.append(
+                    {
+                        "right_points": right_points,
+                        "right_codes": right_codes,
+                        "balltree": tree,
+                        "balltree_rows": tree_rows,
+                    }
+                )
+            elif len(cls._VECTOR_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+                new_right_df = cls._create_vector_cols(
+                    right_df, col, "righty_vector", col_index
+                )
+                right_name = f"righty_vector{col_index}"
+                values = new_right_df.to_numpy(dtype=float)
+                right_keys, right_codes = cls._row_codes(values)
+                right_merge_dfs.append(pd.DataFrame({right_name: right_codes}))
+                new_right_cols.append(right_name)
+                right_cols_to_drop.append(col)
+                # each component is matched on its own, against the sorted values of that component
+                prepared.append(
+                    {
+                        "sorted_choices": [
+                            cls._sorted_choices(values[:, i])
+                            for i in range(values.shape[1])
+                        ],
+                        "right_keys": right_keys,
+                    }
+                )
+            elif len(cls._DATETIME_JOIN_TYPES.intersection(join_types[col_index])) > 0:
+                # datetimes are matched as int64 nanoseconds, the same way as numeric columns
+                right_name = f"righty_datetime{col_index}"
+                values = cls._parse_dt(right_df[col])
+                valid = values != pd.NaT.value
+                choices = np.unique(values[valid])
+                right_merge_dfs.append(
+                    pd.DataFrame(
+                        {
+                            right_name: np.where(
+                                valid, np.searchsorted(choices, values), -2
+                            )
+                        }
+                    )
+                )
+                new_right_cols.append(right_name)
+                right_cols_to_drop.append(col)
+                # the left times are needed for the tolerance as well as the match, so they are
+                # parsed once here and handed to both
+                left_keys = cls._parse_dt(left_df[left_col[col_index]])
+                prepared.append(
+                    {
+                        "left_keys": left_keys,
+                        "choices": choices,
+                        "tolerance": cls._compute_datetime_tolerance(
+                            left_keys, values, accuracy[col_index]
+                        ),
+                    }
+                )
+            else:
+                raise exceptions.InvalidArgumentValueError(
+                    "join not surpported on type " + str(join_types[col_index])
+                )
+
+        merge_right_df = pd.concat([right_df] + right_merge_dfs, axis=1, copy=False)
+        if "d3mIndex" in merge_right_df.columns:
+            right_cols_to_drop.append("d3mIndex")
+        merge_right_df = merge_right_df.drop(columns=right_cols_to_drop)
+
+        return merge_right_df, new_right_cols, prepared
+
     @classmethod
     def _get_join_semantic_type(
         cls,
@@ -611,365 +712,420 @@ class FuzzyJoinPrimitive(
 
     @classmethod
     def _string_fuzzy_match(
-        cls, match: typing.Any, choices: typing.Sequence[typing.Any], min_score: float
-    ) -> typing.Optional[str]:
-        choice, score, index = process.extractOne(match, choices)
-        val = None
-        if score >= min_score:
-            val = choice
-        return val
+        cls,
+        matches: typing.Sequence[typing.Any],
+        choices: typing.Sequence[typing.Any],
+        min_score: float,
+        workers: int = 1,
+    ) -> np.ndarray:
+        # returns the index of the best choice for each match, or -1 if there is none
+        if len(matches) == 0 or len(choices) == 0:
+            return np.full(len(matches), -1)
+
+        # keys are processed once up front and only their distinct processed forms are scored, so
+        # keys that differ only in case or punctuation cost a single comparison
+        match_codes, processed_matches = pd.factorize(
+            np.array([utils.default_process(str(m)) for m in matches], dtype=object)
+        )
+        choice_codes, processed_choices = pd.factorize(
+            np.array([utils.default_process(str(c)) for c in choices], dtype=object)
+        )
+        # the first choice with each processed form, which is the one a full scan would pick
+        _, first_choice = np.unique(choice_codes, return_index=True)
+
+        best = cls._string_best_match(
+            processed_matches, processed_choices, min_score, workers
+        )
+        return np.where(best >= 0, first_choice[best], -1)[match_codes]
+
+    @classmethod
+    def _string_best_match(
+        cls,
+        matches: typing.Sequence[str],
+        choices: typing.Sequence[str],
+        min_score: float,
+        workers: int = 1,
+    ) -> np.ndarray:
+        # score the matches against all of the choices with batched cdist calls, a tile of matches
+        # at a time so that only a (tile, choices) score matrix is ever held - any score that falls
+        # below the cutoff is returned as 0, and each call is spread over `workers` threads - scores
+        # are kept as float64, as cdist otherwise rounds them to uint8 (and float32 still rounds
+        # apart scores that differ only by float noise), so close scores would tie
+        best = np.full(len(matches), -1)
+        for start in range(0, len(matches), cls._STRING_TILE_ROWS):
+            scores = process.cdist(
+                matches[start : start + cls._STRING_TILE_ROWS],
+                choices,
+                scorer=fuzz.WRatio,
+                processor=None,
+                score_cutoff=min_score,
+                dtype=np.float64,
+                workers=workers,
+            )
+            tile_best = scores.argmax(axis=1)
+            tile_score = scores[np.arange(len(tile_best)), tile_best]
+            best[start : start + len(tile_best)] = np.where(tile_score > 0, tile_best, -1)
+        return best
 
     @classmethod
     def _create_string_merge_cols(
         cls,
         left_df: container.DataFrame,
         left_col: str,
-        right_df: container.DataFrame,
-        right_col: str,
+        right_keys: np.ndarray,
         accuracy: float,
         index: int,
+        workers: int = 1,
     ) -> pd.DataFrame:
-
+        # the merge column holds the index of the matching right key, or -1 if there is no match
         if accuracy < 1:
-            left_keys = left_df[left_col].unique()
-            right_keys = right_df[right_col].unique()
-            matches: typing.Dict[str, typing.Optional[str]] = {}
-            for left_key in left_keys:
-                matches[left_key] = cls._string_fuzzy_match(
-                    left_key, right_keys, accuracy * 100
-                )
-            new_left_df = container.DataFrame(
-                {
-                    "lefty_string"
-                    + str(index): left_df[left_col].map(lambda key: matches[key])
-                }
+            left_keys = pd.Index(left_df[left_col].dropna().unique())
+            matches = cls._string_fuzzy_match(
+                left_keys, right_keys, accuracy * 100, workers
             )
+            key_index = left_keys.get_indexer(left_df[left_col])
+            # missing left keys are not in left_keys, so only the rows with a key are looked up
+            codes = np.full(len(key_index), -1)
+            codes[key_index >= 0] = matches[key_index[key_index >= 0]]
         else:
-            new_left_df = container.DataFrame(
-                {"lefty_string" + str(index): left_df[left_col]}
-            )
-        return new_left_df
+            codes = pd.Index(right_keys).get_indexer(left_df[left_col])
+        return pd.DataFrame({f"lefty_string{index}": codes})
 
-    def _numeric_fuzzy_match(match, choices, accuracy, is_absolute):
-        # not sure if this is faster than applying a lambda against the sequence - probably is
-        min_distance = float("inf")
-        min_val = float("nan")
+    @classmethod
+    def _sorted_choices(cls, choices: np.ndarray) -> np.ndarray:
+        # sorted, de-duplicated non-null values to run the nearest match against
+        return np.unique(choices[~np.isnan(choices)])
+
+    @classmethod
+    def _numeric_codes(cls, values: np.ndarray, choices: np.ndarray) -> np.ndarray:
+        # index of each value in the sorted choices it was drawn from - missing values get -2 so
+        # that they never join to an unmatched (-1) left row
+        return np.where(np.isnan(values), -2, np.searchsorted(choices, values))
+
+    @classmethod
+    def _numeric_nearest_match(
+        cls,
+        matches: np.ndarray,
+        choices: np.ndarray,
+        accuracy: float,
+        is_absolute: bool,
+    ) -> np.ndarray:
+        # returns the index of the nearest choice for each match, or -1 if none is within tolerance
+        if len(choices) == 0:
+            return np.full(len(matches), -1)
+
+        # binary search the sorted choices for the neighbours on either side of each match
+        idx = np.searchsorted(choices, matches)
+        lower = np.clip(idx - 1, 0, len(choices) - 1)
+        upper = np.clip(idx, 0, len(choices) - 1)
+        lower_distance = np.abs(matches - choices[lower])
+        upper_distance = np.abs(matches - choices[upper])
+        # a match that is equally close to two choices takes the lower one, whatever order the
+        # right rows are in
+        nearest = np.where(lower_distance <= upper_distance, lower, upper)
+        distance = np.minimum(lower_distance, upper_distance)
+
+        # keep the nearest neighbour only if it falls within the tolerance - an absolute tolerance
+        # is a single scalar compare per match
         if is_absolute:
-            tolerance = accuracy
-        else:
-            inv_accuracy = 1.0 - accuracy
-            tolerance = float(match) * inv_accuracy
-        for i, num in enumerate(choices):
-            distance = abs(match - num)
-            if distance <= tolerance and distance <= min_distance:
-                min_val = num
-                min_distance = distance
-        return min_val
-
-    def _geo_fuzzy_match(match, choices, col, accuracy, is_absolute):
-        # assume the accuracy is meters
-        if not is_absolute:
-            raise exceptions.InvalidArgumentTypeError(
-                "geo fuzzy match requires an absolute accuracy parameter that specifies the tolerance in meters"
-            )
+            return np.where(distance <= accuracy, nearest, -1)
+        return np.where(distance <= np.abs(matches) * (1.0 - accuracy), nearest, -1)
 
-        # keep the set of choices that falls within the acceptable distance
-        return choices[choices[col].map(lambda x: hs.haversine(match, x, Unit.METERS)) < accuracy]
+    @classmethod
+    def _haversine_batch(
+        cls,
+        lat1: typing.Union[float, np.ndarray],
+        lon1: typing.Union[float, np.ndarray],
+        lat2: typing.Union[float, np.ndarray],
+        lon2: typing.Union[float, np.ndarray],
+    ) -> np.ndarray:
+        # haversine of the central angle between points given in degrees, broadcast across arrays
+        # the final 2R * asin(sqrt(...)) is left off since callers only compare against a threshold
+        lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+        return (
+            np.sin((lat2 - lat1) * 0.5) ** 2
+            + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+        )
+
+    @classmethod
+    def _haversine_threshold(cls, meters: float) -> float:
+        # convert a distance in meters to the value returned by _haversine_batch
+        return np.sin(min(meters / (2 * cls._EARTH_RADIUS_METERS), np.pi / 2)) ** 2
 
     @classmethod
     def _create_numeric_merge_cols(
         cls,
         left_df: container.DataFrame,
         left_col: str,
-        right_df: container.DataFrame,
-        right_col: str,
+        choices: np.ndarray,
         accuracy: float,
         index: int,
         is_absolute: bool,
     ) -> pd.DataFrame:
-        choices = right_df[right_col].unique()
-        new_left_df = container.DataFrame(
+        # match the distinct left values and broadcast the result back to the rows
+        left_keys, inverse = np.unique(
+            pd.to_numeric(left_df[left_col]).to_numpy(dtype=float), return_inverse=True
+        )
+        new_left_df = pd.DataFrame(
             {
-                "lefty_numeric"
-                + str(index): pd.to_numeric(left_df[left_col]).map(
-                    lambda x: cls._numeric_fuzzy_match(
-                        x, choices, accuracy, is_absolute
-                    )
-                )
+                f"lefty_numeric{index}": cls._numeric_nearest_match(
+                    left_keys, choices, accuracy, is_absolute
+                )[inverse.reshape(-1)]
             }
         )
         return new_left_df
 
+    @classmethod
+    def _row_codes(cls, values: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        # number the distinct rows of a 2d array, returning the distinct rows along with the code
+        # of each row - rows with missing values get -2 so they never join to an unmatched (-1) row
+        valid = ~np.isnan(values).any(axis=1)
+        codes = np.full(len(values), -2)
+        if not valid.any():
+            return np.empty((0, values.shape[1])), codes
+        uniques, inverse = np.unique(values[valid], axis=0, return_inverse=True)
+        codes[valid] = inverse.reshape(-1)
+        return uniques, codes
+
+    @classmethod
+    def _is_str_col(cls, series: pd.Series) -> bool:
+        # vector columns hold either comma separated strings or arrays - the dtype rules out most
+        # columns up front and the first value settles object columns
+        return pd.api.types.is_string_dtype(series.dtype) and isinstance(series.iat[0], str)
+
+    @classmethod
+    def _split_vector_strings(cls, series: pd.Series) -> np.ndarray:
+        # split comma separated vector strings into a (rows, components) float array - trailing
+        # separators are dropped first, as np.fromstring(sep=",") used to ignore them
+        return series.str.rstrip(", ").str.split(",", expand=True).to_numpy(dtype=float)
+
+    @classmethod
+    def _create_geo_points(
+        cls,
+        df: container.DataFrame,
+        col: str,
+    ) -> np.ndarray:
+        # parse a vector column of (lat, lon) points into a single (rows, points, 2) array rather
+        # than row by row - the array is used as is, without wrapping the points back up as tuples
+        if cls._is_str_col(df[col]):
+            values = cls._split_vector_strings(df[col])
+        else:
+            values = np.stack(df[col].values).astype(float, copy=False)
+        return values.reshape(len(values), -1, 2)
+
+    @classmethod
+    def _create_geo_index(
+        cls, points: np.ndarray
+    ) -> typing.Tuple[typing.Optional[BallTree], np.ndarray]:
+        # index a (rows, 2) array of (lat, lon) points with a haversine ball tree, leaving out
+        # missing points - the row number of each indexed point is returned along with the tree
+        radians = np.radians(points)
+        rows = np.flatnonzero(np.isfinite(radians).all(axis=1)).astype(np.int32)
+        if len(rows) == 0:
+            return None, rows
+        return BallTree(radians[rows], metric="haversine"), rows
+
     @classmethod
     def _create_geo_vector_merging_cols(
         cls,
         left_df: container.DataFrame,
         left_col: str,
-        right_df: container.DataFrame,
-        right_col: str,
+        right_points: np.ndarray,
+        right_codes: np.ndarray,
+        tree: typing.Optional[BallTree],
+        tree_rows: np.ndarray,
         accuracy: float,
         index: int,
         is_absolute: bool,
     ) -> pd.DataFrame:
-        def fromstring(x: str) -> np.ndarray:
-            return np.fromstring(x, dtype=float, sep=",")
-        def topoints(x: np.ndarray) -> typing.Sequence[typing.Sequence[float]]:
-            # create a sequence of points by joining two successive values
-            it = iter(x)
-            return list(zip(it, it))
-
-        if type(left_df[left_col].iloc[0]) == str:
-            left_vector_length = np.fromstring(
-                left_df[left_col].iloc[0], dtype=float, sep=","
-            ).shape[0]
-            new_left_cols = [
-                "lefty_vector" + str(index) + "_" + str(i)
-                for i in range(int(left_vector_length/2))
-            ]
-            new_left_df = container.DataFrame(
-                left_df[left_col]
-                .apply(fromstring, convert_dtype=False)
-                .apply(topoints)
-                .values.tolist(),
-                columns=new_left_cols,
-            )
-        else:
-            left_vector_length = left_df[left_col].iloc[0].shape[0]
-            new_left_cols = [
-                "lefty_vector" + str(index) + "_" + str(i)
-                for i in range(int(left_vector_length/2))
-            ]
-            new_left_df = container.DataFrame(
-                left_df[left_col].apply(topoints).values.tolist(),
-                columns=new_left_cols,
+        # assume the accuracy is meters
+        if not is_absolute:
+            raise exceptions.InvalidArgumentTypeError(
+                "geo fuzzy match requires an absolute accuracy parameter that specifies the tolerance in meters"
             )
-        if type(right_df[right_col].iloc[0]) == str:
-            right_vector_length = np.fromstring(
-                right_df[right_col].iloc[0], dtype=float, sep=","
-            ).shape[0]
-            new_right_cols = [
-                "righty_vector" + str(index) + "_" + str(i)
-                for i in range(int(right_vector_length/2))
-            ]
-            new_right_df = container.DataFrame(
-                right_df[right_col]
-                .apply(fromstring, convert_dtype=False)
-                .apply(topoints)
-                .values.tolist(),
-                columns=new_right_cols,
+
+        # only match the distinct left geometries - the codes are broadcast back to the rows at the end
+        left_values = cls._create_geo_points(left_df, left_col)
+        left_values = left_values.reshape(len(left_values), -1)
+        _, first_rows, inverse = np.unique(
+            left_values, axis=0, return_index=True, return_inverse=True
+        )
+        left_points = left_values[first_rows].reshape(len(first_rows), -1, 2)
+
+        # get an initial set of possible matches (should usually be a very small subset) by
+        # running a radius query against the index of the first point of each right polygon
+        left_radians = np.radians(left_points[:, 0])
+        left_valid = np.flatnonzero(np.isfinite(left_radians).all(axis=1))
+        # the pairs are held as int32 row numbers to halve the memory of the pair arrays
+        pair_left = np.empty(0, dtype=np.int32)
+        pair_right = np.empty(0, dtype=np.int32)
+        if len(left_valid) > 0 and tree is not None:
+            neighbours = tree.query_radius(
+                left_radians[left_valid], r=accuracy / cls._EARTH_RADIUS_METERS
             )
-        else:
-            right_vector_length = right_df[right_col].iloc[0].shape[0]
-            new_right_cols = [
-                "righty_vector" + str(index) + "_" + str(i)
-                for i in range(int(right_vector_length/2))
-            ]
-            new_right_df = container.DataFrame(
-                right_df[right_col].apply(topoints).values.tolist(),
-                columns=new_right_cols,
+            # flatten the neighbour lists into (left, right) candidate pairs, ordered by right row
+            # within each left row so the first match is the same as a linear scan
+            pair_left = np.repeat(
+                left_valid.astype(np.int32), [len(n) for n in neighbours]
             )
+            pair_right = tree_rows[np.concatenate(neighbours)]
+            order = np.lexsort((pair_right, pair_left))
+            pair_left = pair_left[order]
+            pair_right = pair_right[order]
+
+        # narrow down the matches by checking every point of every (left, candidate) pair in a
+        # single pass - a pair survives only if all of its points are within range
+        # the radius query is inclusive so the first point gets checked again
+        num_points = left_points.shape[1]
+        distances = cls._haversine_batch(
+            left_points[pair_left, :, 0],
+            left_points[pair_left, :, 1],
+            right_points[pair_right, :num_points, 0],
+            right_points[pair_right, :num_points, 1],
+        )
+        keep = (distances < cls._haversine_threshold(accuracy)).all(axis=1)
 
-        # get a unique name to hold the possible matches
-        base_name = 'righty_lefty'
-        unique_name = base_name
-        count = 1
-        while unique_name in new_left_df.columns:
-            unique_name = base_name + f'_{count}'
-            count = count + 1
-
-        # get an initial set of possible matches (should usually be a very small subset)
-        new_left_df[unique_name] = pd.Series([cls._geo_fuzzy_match(
-            p,
-            new_right_df,
-            new_right_cols[0],
-            accuracy,
-            is_absolute
-        ) for p in new_left_df[new_left_cols[0]]])
-
-        # process the remaining vector values to narrow down the set of matches
-        # this couldve all been done in a single loop but this keep it slightly cleaner
-        for i in range(1, len(new_left_cols)):
-            new_left_df[unique_name] = pd.Series([cls._geo_fuzzy_match(
-                p,
-                f,
-                new_right_cols[i],
-                accuracy,
-                is_absolute
-            ) for (p, f) in zip(new_left_df[new_left_cols[i]], new_left_df[unique_name])])
-
-        # reduce the set of matches to either the first match or an empty set
+        # reduce the set of matches to the code of the first match, or -1 if there is none
         # NOTE: THIS IS NOT THE BEST WAY
         #   FOR JOINS, EITHER ALL MATCHES SHOULD BE KEPT OR ONLY THE CLOSEST MATCH SHOULD BE KEPT
         #   THE PREVIOUS IMPLEMENTATION WAS EVEN WORSE AS IT ONLY KEPT THE NEAREST MATCH AT ANY GIVEN POINT
         #   SO IF ONE POLYGON WAS NOT NEAREST AT EVERY POINT, THEN NO MATCH WAS MADE
-        tmp_df_left = pd.concat(new_left_df[unique_name].map(lambda x: x.head(1) if len(x) > 0 else pd.DataFrame([[None] * len(new_right_cols)], columns=new_right_cols)).tolist(), ignore_index=True)
-        new_left_df[new_left_cols] = tmp_df_left[new_right_cols]
-        new_left_df.drop(columns=[unique_name], inplace=True)
+        matched_left, first_pair = np.unique(pair_left[keep], return_index=True)
+        first = np.full(len(left_points), -1)
+        first[matched_left] = pair_right[keep][first_pair]
+        codes = np.where(first >= 0, right_codes[first], -1)[inverse.reshape(-1)]
+        return pd.DataFrame({f"lefty_vector{index}": codes})
+
+    @classmethod
+    def _create_vector_cols(
+        cls,
+        df: container.DataFrame,
+        col: str,
+        prefix: str,
+        index: int,
+    ) -> pd.DataFrame:
+        # split a vector column into one column per vector component - the values are parsed into a
+        # single (rows, components) array and handed to the frame in one shot
+        if cls._is_str_col(df[col]):
+            values = cls._split_vector_strings(df[col])
+        else:
+            values = np.stack(df[col].values).astype(float, copy=False)
+
+        return pd.DataFrame(
+            values, columns=cls._gen_cols(prefix, index, values.shape[1]), copy=False
+        )
 
-        return (new_left_df, new_right_df)
+    @classmethod
+    def _gen_cols(cls, prefix: str, index: int, count: int) -> typing.List[str]:
+        # names for the columns a multi-valued join column is split into
+        return [f"{prefix}{index}_{i}" for i in range(count)]
 
     @classmethod
     def _create_vector_merging_cols(
         cls,
         left_df: container.DataFrame,
         left_col: str,
-        right_df: container.DataFrame,
-        right_col: str,
+        choices: typing.Sequence[np.ndarray],
+        right_keys: np.ndarray,
         accuracy: float,
         index: int,
         is_absolute: bool,
     ) -> pd.DataFrame:
-        def fromstring(x: str) -> np.ndarray:
-            return np.fromstring(x, dtype=float, sep=",")
-
-        if type(left_df[left_col].iloc[0]) == str:
-            left_vector_length = np.fromstring(
-                left_df[left_col].iloc[0], dtype=float, sep=","
-            ).shape[0]
-            new_left_cols = [
-                "lefty_vector" + str(index) + "_" + str(i)
-                for i in range(left_vector_length)
-            ]
-            new_left_df = container.DataFrame(
-                left_df[left_col]
-                .apply(fromstring, convert_dtype=False)
-                .values.tolist(),
-                columns=new_left_cols,
-            )
-        else:
-            left_vector_length = left_df[left_col].iloc[0].shape[0]
-            new_left_cols = [
-                "lefty_vector" + str(index) + "_" + str(i)
-                for i in range(left_vector_length)
-            ]
-            new_left_df = container.DataFrame(
-                left_df[left_col].values.tolist(),
-                columns=new_left_cols,
-            )
-        if type(right_df[right_col].iloc[0]) == str:
-            right_vector_length = np.fromstring(
-                right_df[right_col].iloc[0], dtype=float, sep=","
-            ).shape[0]
-            new_right_cols = [
-                "righty_vector" + str(index) + "_" + str(i)
-                for i in range(right_vector_length)
-            ]
-            new_right_df = container.DataFrame(
-                right_df[right_col]
-                .apply(fromstring, convert_dtype=False)
-                .values.tolist(),
-                columns=new_right_cols,
+        new_left_df = cls._create_vector_cols(left_df, left_col, "lefty_vector", index)
+
+        # match the distinct values of each component to the nearest value of that component on the
+        # right with a binary search over the sorted right values, and broadcast back to the rows
+        matched = np.full(new_left_df.shape, np.nan)
+        for i in range(new_left_df.shape[1]):
+            values, inverse = np.unique(
+                new_left_df.iloc[:, i].to_numpy(dtype=float), return_inverse=True
             )
-        else:
-            right_vector_length = right_df[right_col].iloc[0].shape[0]
-            new_right_cols = [
-                "righty_vector" + str(index) + "_" + str(i)
-                for i in range(right_vector_length)
-            ]
-            new_right_df = container.DataFrame(
-                right_df[right_col].values.tolist(),
-                columns=new_right_cols,
-            )
-
-        for i in range(len(new_left_cols)):
-            new_left_df[new_left_cols[i]] = new_left_df[new_left_cols[i]].map(
-                lambda x: cls._numeric_fuzzy_match(
-                    x,
-                    new_right_df[new_right_cols[i]],
-                    accuracy,
-                    is_absolute,
-                )
+            nearest = cls._numeric_nearest_match(values, choices[i], accuracy, is_absolute)
+            # only the matched values are looked up, as a component with no values on the right
+            # has nothing to index into
+            component = np.full(len(values), np.nan)
+            hit = nearest >= 0
+            component[hit] = choices[i][nearest[hit]]
+            matched[:, i] = component[inverse.reshape(-1)]
+
+        # look up the code of the right value made up of the matched components - rows where any
+        # component went unmatched get -1
+        valid = ~np.isnan(matched).any(axis=1)
+        codes = np.full(len(matched), -1)
+        if valid.any() and len(right_keys) > 0:
+            codes[valid] = pd.MultiIndex.from_arrays(list(right_keys.T)).get_indexer(
+                pd.MultiIndex.from_arrays(list(matched[valid].T))
             )
-        return (new_left_df, new_right_df)
+        return pd.DataFrame({f"lefty_vector{index}": codes})
 
     @classmethod
     def _create_datetime_merge_cols(
         cls,
-        left_df: container.DataFrame,
-        left_col: str,
-        right_df: container.DataFrame,
-        right_col: str,
-        tolerance: float,
+        left_keys: np.ndarray,
+        choices: np.ndarray,
+        tolerance: int,
         index: int,
     ) -> pd.DataFrame:
-        # use d3mIndex from left col if present
-        # compute a tolerance delta for time matching based on a percentage of the minimum left/right time
-        # range
-        left_name = "lefty_datetime" + str(index)
-        right_name = "righty_datetime" + str(index)
-        new_right_df = container.DataFrame(
-            {
-                right_name: np.array(
-                    [np.datetime64(parser.parse(dt)) for dt in right_df[right_col]]
-                )
-            }
-        )
-        choices = np.unique(new_right_df[right_name])
-        left_keys = np.array(
-            [np.datetime64(parser.parse(dt)) for dt in left_df[left_col].values]
-        )
-
-        new_left_df = container.DataFrame(
-            {
-                left_name: np.array(
-                    [
-                        cls._datetime_fuzzy_match(dt, choices, tolerance)
-                        for dt in left_keys
-                    ]
-                )
-            }
-        )
-        return new_left_df, new_right_df
+        # match each left time to the index of the nearest right time that falls within the
+        # tolerance, using the same binary search as numeric columns - unparseable times never match
+        left_name = f"lefty_datetime{index}"
+        valid = left_keys != pd.NaT.value
+        unique_keys, inverse = np.unique(left_keys[valid], return_inverse=True)
+        codes = np.full(len(left_keys), -1)
+        codes[valid] = cls._numeric_nearest_match(
+            unique_keys, choices, tolerance, True
+        )[inverse.reshape(-1)]
+        return pd.DataFrame({left_name: codes})
 
     @classmethod
-    def _datetime_fuzzy_match(
-        cls,
-        match: np.datetime64,
-        choices: typing.Sequence[np.datetime64],
-        tolerance: np.timedelta64,
-    ) -> typing.Optional[np.datetime64]:
-        min_distance = None
-        min_date = None
-        for i, date in enumerate(choices):
-            distance = abs(match - date)
-            if distance <= tolerance and (
-                min_distance is None or distance < min_distance
-            ):
-                min_distance = distance
-                min_date = date
+    def _parse_dt(cls, series: pd.Series) -> np.ndarray:
+        # parse a column of datetimes to int64 nanoseconds in a single vectorized call, caching
+        # repeated strings - times with an offset are converted to UTC, and values that can't be
+        # parsed come back as NaT (pd.NaT.value)
+        parsed = pd.to_datetime(series, cache=True, errors="coerce", utc=True)
+        keys = (
+            pd.DatetimeIndex(parsed)
+            .tz_convert(None)
+            .to_numpy(dtype="datetime64[ns]", copy=True)
+            .view("i8")
+        )
 
-        # default empty match to NaT to make it valid for datetime typing
-        if min_date is None:
-            min_date = pd.NaT
-        return min_date
+        # the vectorized parse infers a single format from the data, so values written in any
+        # other format come back as NaT - re-parse each of those individually with dateutil
+        missed = np.flatnonzero((keys == pd.NaT.value) & series.notna().to_numpy())
+        if len(missed) > 0:
+            unique_missed, inverse = np.unique(
+                series.iloc[missed].astype(str).to_numpy(), return_inverse=True
+            )
+            keys[missed] = np.array(
+                [cls._parse_dt_value(value) for value in unique_missed], dtype=np.int64
+            )[inverse.reshape(-1)]
+        return keys
 
     @classmethod
-    def _compute_time_range(
-        cls, left: typing.Sequence[np.datetime64], right: typing.Sequence[np.datetime64]
-    ) -> float:
-        left_min = np.amin(left)
-        left_max = np.amax(left)
-        left_delta = left_max - left_min
+    def _parse_dt_value(cls, value: str) -> int:
+        try:
+            timestamp = pd.Timestamp(parser.parse(value))
+        except (ValueError, OverflowError):
+            return pd.NaT.value
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+        return timestamp.value
 
-        right_min = np.amin(right)
-        right_max = np.amax(right)
-        right_delta = right_max - right_min
+    @classmethod
+    def _compute_time_range(cls, left: np.ndarray, right: np.ndarray) -> float:
+        if len(left) == 0 or len(right) == 0:
+            return 0.0
 
-        return min(left_delta, right_delta)
+        return min(np.ptp(left), np.ptp(right))
 
     @classmethod
-    def _compute_datetime_tolerance(cls,
-        left_df: container.DataFrame,
-        left_col: str,
-        right_df: container.DataFrame,
-        right_col: str,
-        accuracy: float
-    ) -> typing.Dict[str, float]:
-        new_right_df = np.array(
-            [np.datetime64(parser.parse(dt)) for dt in right_df[right_col]]
-        )
-        choices = np.unique(new_right_df)
-        left_keys = np.array(
-            [np.datetime64(parser.parse(dt)) for dt in left_df[left_col].values]
-        )
-        return (1.0 - accuracy) * cls._compute_time_range(left_keys, choices)
+    def _compute_datetime_tolerance(
+        cls, left_keys: np.ndarray, right_keys: np.ndarray, accuracy: float
+    ) -> int:
+        # the keys are the int64 nanosecond times returned by _parse_dt, and the tolerance is
+        # returned in whole nanoseconds, ignoring any times that could not be parsed - rounding it
+        # down keeps the comparison in int64 without changing which times fall within it
+        right_keys = right_keys[right_keys != pd.NaT.value]
+        left_keys = left_keys[left_keys != pd.NaT.value]
+        return int(np.floor((1.0 - accuracy) * cls._compute_time_range(left_keys, right_keys)))
@@ -36,8 +36,7 @@ setup(
         "pandas>=1.1.3",
         # additional dependencies
         "joblib>=0.13.2",
-        "haversine==2.3.1",
-        "rapidfuzz==1.5.1"
+        "rapidfuzz==1.9.1"
     ],
     entry_points={
         "d3m.primitives": [
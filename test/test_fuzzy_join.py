@@ -15,9 +15,10 @@
 
 import unittest
 from os import path
+from unittest import mock
 import numpy as np
 
-from d3m import container
+from d3m import container, exceptions
 from distil.primitives.column_parser import ColumnParserPrimitive
 from distil_primitives_contrib.fuzzy_join import FuzzyJoinPrimitive as FuzzyJoin
 from d3m.metadata import base as metadata_base
@@ -88,6 +89,128 @@ class FuzzyJoinPrimitiveTestCase(unittest.TestCase):
             )
         )
 
+    def test_tiled_string_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "alpha",
+                "right_col": "alpha",
+                "accuracy": 0.9,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+
+        # score two left keys per cdist call, so the matches are stitched together from several
+        # tiles - the result should be the same as test_string_join
+        with mock.patch.object(FuzzyJoin, "_STRING_TILE_ROWS", 2):
+            result_dataset = fuzzy_join.produce(
+                left=dataframe_1, right=dataframe_2
+            ).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [100.0, 100.0, 100.0, 200.0, 200.0, np.nan, 300.0, 300.0],
+            )
+        )
+
+    def test_missing_key_string_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # no left row has a key, so none of them should be joined
+        dataframe_1["0"]["alpha"] = [np.nan] * 8
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "alpha",
+                "right_col": "alpha",
+                "accuracy": 0.8,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(list(result_dataframe["charlie"]), [np.nan] * 8)
+        )
+
+    def test_close_score_string_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # bccddadb scores 62.5 against bcabceda and 63.16 against bcbcbbbbddb - both round to 63,
+        # so the join only picks the better key if the scores aren't rounded
+        dataframe_1["0"]["alpha"] = dataframe_1["0"]["alpha"].where(
+            dataframe_1["0"]["d3mIndex"] != 1, "bccddadb"
+        )
+        dataframe_2["0"]["alpha"] = ["bcabceda", "bcbcbbbbddb", "foxtrot", "golf"]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "alpha",
+                "right_col": "alpha",
+                "accuracy": 0.6,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertEqual(list(result_dataframe["d3mIndex"])[0], 1)
+        self.assertEqual(list(result_dataframe["charlie"])[0], 200.0)
+
+    def test_float_noise_string_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # cBaca scores 60.0 against bea,a and 59.99999999999999 against aAB - both are 60.0 as
+        # float32, so the join only picks the better key if the scores are float64
+        dataframe_1["0"]["alpha"] = dataframe_1["0"]["alpha"].where(
+            dataframe_1["0"]["d3mIndex"] != 1, "cBaca"
+        )
+        dataframe_2["0"]["alpha"] = ["bea,a", "aAB", "foxtrot", "golf"]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "alpha",
+                "right_col": "alpha",
+                "accuracy": 0.55,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertEqual(list(result_dataframe["d3mIndex"])[0], 1)
+        self.assertEqual(list(result_dataframe["charlie"])[0], 100.0)
+
     def test_exact_string_join(self) -> None:
         dataframe_1 = self._load_data(self._dataset_path_1)
         dataframe_2 = self._load_data(self._dataset_path_2)
@@ -261,29 +384,264 @@ class FuzzyJoinPrimitiveTestCase(unittest.TestCase):
         self.assertListEqual(
             list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
         )
-        self.assertListEqual(
-            list(result_dataframe["alpha_left"]),
-            [
-                "yankee",
-                "yankeee",
-                "yank",
-                "Hotel",
-                "hotel",
-                "otel",
-                "foxtrot aa",
-                "foxtrot",
-            ],
-        )
+        self.assertListEqual(
+            list(result_dataframe["alpha_left"]),
+            [
+                "yankee",
+                "yankeee",
+                "yank",
+                "Hotel",
+                "hotel",
+                "otel",
+                "foxtrot aa",
+                "foxtrot",
+            ],
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                ["hotel", "hotel", "hotel", "hotel", np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+        self.assertListEqual(
+            list(result_dataframe["whiskey"]),
+            [10.0, 10.0, 10.0, 10.0, 20.0, 20.0, 20.0, 20.0],
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [200.0, 200.0, 200.0, 200.0, np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+
+    def test_numeric_tie_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "whiskey",
+                "right_col": "xray",
+                "accuracy": 1.0,
+                "absolute_accuracy": True,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+
+        # 10.0 is equally close to 9.0 and 11.0, and joins to the lower value whichever order
+        # the right rows are in
+        dataframe_2["0"]["xray"] = [11.0, 9.0, 17.0, 23.1]
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [200.0, 200.0, 200.0, 200.0, np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+
+        dataframe_2["0"]["xray"] = [9.0, 11.0, 17.0, 23.1]
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [100.0, 100.0, 100.0, 100.0, np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+
+    def test_numeric_outer_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "whiskey",
+                "right_col": "xray",
+                "accuracy": 0.9,
+                "absolute_accuracy": False,
+                "join_type": "outer",
+                "n_jobs": 2,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output - each unmatched right row appears once, whatever n_jobs is
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_left"]),
+                [
+                    "yankee",
+                    "yankeee",
+                    "yank",
+                    "Hotel",
+                    "hotel",
+                    "otel",
+                    "foxtrot aa",
+                    "foxtrot",
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                ],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                [
+                    "hotel",
+                    "hotel",
+                    "hotel",
+                    "hotel",
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                    "yankee",
+                    "foxtrot",
+                    "golf",
+                ],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [
+                    200.0,
+                    200.0,
+                    200.0,
+                    200.0,
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                    100.0,
+                    300.0,
+                    400.0,
+                ],
+            )
+        )
+
+    def test_numeric_negative_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # the relative tolerance is taken from the magnitude of the key, so negating both sides
+        # should give the same join
+        dataframe_1["0"]["whiskey"] = -dataframe_1["0"]["whiskey"]
+        dataframe_2["0"]["xray"] = -dataframe_2["0"]["xray"]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "whiskey",
+                "right_col": "xray",
+                "accuracy": 0.9,
+                "absolute_accuracy": False,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                ["hotel", "hotel", "hotel", "hotel", np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [200.0, 200.0, 200.0, 200.0, np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+
+    def test_numeric_right_index_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # the right rows should be matched by position, whatever the right frame's index is
+        dataframe_2["0"].index = range(100, 100 + len(dataframe_2["0"]))
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "whiskey",
+                "right_col": "xray",
+                "accuracy": 0.9,
+                "absolute_accuracy": False,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                ["hotel", "hotel", "hotel", "hotel", np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [200.0, 200.0, 200.0, 200.0, np.nan, np.nan, np.nan, np.nan],
+            )
+        )
+
+    def test_numeric_missing_key_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # golf has no key, so it should never be joined
+        dataframe_2["0"]["xray"] = [11.0, 9.5, 17.0, np.nan]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "whiskey",
+                "right_col": "xray",
+                "accuracy": 0.9,
+                "absolute_accuracy": False,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output - the unmatched left rows are not joined to golf
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
         self.assertTrue(
             self.assertNumpyListEqual(
                 list(result_dataframe["alpha_right"]),
                 ["hotel", "hotel", "hotel", "hotel", np.nan, np.nan, np.nan, np.nan],
             )
         )
-        self.assertListEqual(
-            list(result_dataframe["whiskey"]),
-            [10.0, 10.0, 10.0, 10.0, 20.0, 20.0, 20.0, 20.0],
-        )
         self.assertTrue(
             self.assertNumpyListEqual(
                 list(result_dataframe["charlie"]),
@@ -485,6 +843,135 @@ class FuzzyJoinPrimitiveTestCase(unittest.TestCase):
             ],
         )
 
+    def test_vector_negative_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # the relative tolerance is taken from the magnitude of each component, so negating both
+        # sides should match the same rows as test_vector_join
+        dataframe_1["0"]["gamma"] = dataframe_1["0"]["gamma"].map(lambda v: -v)
+        dataframe_2["0"]["gamma"] = dataframe_2["0"]["gamma"].map(lambda v: -v)
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "gamma",
+                "right_col": "gamma",
+                "accuracy": 0.95,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                [
+                    "yankee",
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                    "yankee",
+                    "foxtrot",
+                    "foxtrot",
+                    "golf",
+                ],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [100.0, np.nan, np.nan, np.nan, 100.0, 300.0, 300.0, 400.0],
+            )
+        )
+
+    def test_vector_string_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # unparsed vectors, some of them written with a trailing separator
+        dataframe_1["0"]["gamma"] = [
+            "10,20,",
+            "5,3,",
+            "30,52",
+            "5,3,",
+            "10,20",
+            "13,13,",
+            "13,13",
+            "3,5,",
+        ]
+        dataframe_2["0"]["gamma"] = ["10,20", "5,3.2,", "12.9,13.1", "3,5,"]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "gamma",
+                "right_col": "gamma",
+                "accuracy": 0.95,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                [
+                    "yankee",
+                    np.nan,
+                    np.nan,
+                    np.nan,
+                    "yankee",
+                    "foxtrot",
+                    "foxtrot",
+                    "golf",
+                ],
+            )
+        )
+
+    def test_vector_missing_component_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # the second component is missing on every right row, so nothing can be matched
+        dataframe_2["0"]["gamma"] = ["10,nan", "5,nan", "12.9,nan", "3,nan"]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "gamma",
+                "right_col": "gamma",
+                "accuracy": 0.9,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(list(result_dataframe["charlie"]), [np.nan] * 8)
+        )
+
     def test_date_join(self) -> None:
         dataframe_1 = self._load_data(self._dataset_path_1)
         dataframe_2 = self._load_data(self._dataset_path_2)
@@ -561,6 +1048,111 @@ class FuzzyJoinPrimitiveTestCase(unittest.TestCase):
             )
         )
 
+    def test_date_mixed_format_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # the same times as dataset 1, written in a mix of formats
+        dataframe_1["0"]["sierra"] = [
+            "2019-01-21 10:54:21",
+            "01/21/2019 10:54:21",
+            "Jan 21 2019 10:54:21",
+            "2019-01-21T10:54:21",
+            "Jan 21 2019 10:55:21",
+            "01/21/2019 10:55:21",
+            "2019-01-22 10:54:21",
+            "22 Jan 2019 10:54:21",
+        ]
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "sierra",
+                "right_col": "tango",
+                "accuracy": 0.8,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                [
+                    "yankee",
+                    "yankee",
+                    "yankee",
+                    "yankee",
+                    "foxtrot",
+                    "foxtrot",
+                    np.nan,
+                    np.nan,
+                ],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [100.0, 100.0, 100.0, 100.0, 300.0, 300.0, np.nan, np.nan],
+            )
+        )
+
+    def test_date_unparseable_join(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        # a time that can't be parsed doesn't match anything, rather than failing the join
+        dataframe_1["0"]["sierra"] = dataframe_1["0"]["sierra"].where(
+            dataframe_1["0"]["d3mIndex"] != 2, "not a time"
+        )
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": "sierra",
+                "right_col": "tango",
+                "accuracy": 0.8,
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        result_dataset = fuzzy_join.produce(left=dataframe_1, right=dataframe_2).value
+        result_dataframe = result_dataset["0"]
+
+        # verify the output
+        self.assertListEqual(
+            list(result_dataframe["d3mIndex"]), [1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["alpha_right"]),
+                [
+                    "yankee",
+                    np.nan,
+                    "yankee",
+                    "yankee",
+                    "foxtrot",
+                    "foxtrot",
+                    np.nan,
+                    np.nan,
+                ],
+            )
+        )
+        self.assertTrue(
+            self.assertNumpyListEqual(
+                list(result_dataframe["charlie"]),
+                [100.0, np.nan, 100.0, 100.0, 300.0, 300.0, np.nan, np.nan],
+            )
+        )
+
     def test_date_string_join(self) -> None:
         dataframe_1 = self._load_data(self._dataset_path_1)
         dataframe_2 = self._load_data(self._dataset_path_2)
@@ -711,6 +1303,59 @@ class FuzzyJoinPrimitiveTestCase(unittest.TestCase):
             ],
         )
 
+    def test_invalid_hyperparams(self) -> None:
+        dataframe_1 = self._load_data(self._dataset_path_1)
+        dataframe_2 = self._load_data(self._dataset_path_2)
+
+        hyperparams_class = FuzzyJoin.metadata.query()["primitive_code"][
+            "class_type_arguments"
+        ]["Hyperparams"]
+
+        # a different number of left and right columns
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": ["alpha", "sierra"],
+                "right_col": ["alpha"],
+                "accuracy": [0.9, 0.8],
+                "absolute_accuracy": [False, False],
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        with self.assertRaisesRegex(
+            exceptions.InvalidArgumentTypeError, "the same list lengths"
+        ):
+            fuzzy_join.produce(left=dataframe_1, right=dataframe_2)
+
+        # a different number of accuracies and columns
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": ["alpha", "sierra"],
+                "right_col": ["alpha", "tango"],
+                "accuracy": [0.9],
+                "absolute_accuracy": [False],
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        with self.assertRaisesRegex(
+            exceptions.InvalidArgumentValueError, "count of join columns"
+        ):
+            fuzzy_join.produce(left=dataframe_1, right=dataframe_2)
+
+        # a different number of accuracies and absolute accuracies
+        hyperparams = hyperparams_class.defaults().replace(
+            {
+                "left_col": ["alpha", "sierra"],
+                "right_col": ["alpha", "tango"],
+                "accuracy": [0.9, 0.8],
+                "absolute_accuracy": [False],
+            }
+        )
+        fuzzy_join = FuzzyJoin(hyperparams=hyperparams)
+        with self.assertRaisesRegex(
+            exceptions.InvalidArgumentValueError, "count of absolute_accuracy"
+        ):
+            fuzzy_join.produce(left=dataframe_1, right=dataframe_2)
+
     def _load_data(cls, dataset_path: str) -> container.DataFrame:
         dataset_doc_path = path.join(dataset_path, "datasetDoc.json")
 